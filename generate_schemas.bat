@@ -17,8 +17,8 @@ echo Python detected:
 python --version
 echo.
 
-:: Check if pandas is installed
-python -c "import pandas" >nul 2>&1
+:: Check if dependencies are installed
+python -c "import orjson" >nul 2>&1
 if errorlevel 1 (
     echo Installing dependencies...
     pip install -r requirements.txt
@@ -33,7 +33,7 @@ echo.
 echo Running schema generator...
 echo.
 
-python schema_generator.py
+python schema_generator.py %*
 
 if errorlevel 1 (
     echo.
@@ -16,8 +16,8 @@ echo "Python detected:"
 python3 --version
 echo ""
 
-# Check if pandas is installed
-python3 -c "import pandas" 2>/dev/null
+# Check if dependencies are installed
+python3 -c "import orjson" 2>/dev/null
 if [ $? -ne 0 ]; then
     echo "Installing dependencies..."
     pip3 install -r requirements.txt
@@ -31,7 +31,7 @@ echo ""
 echo "Running schema generator..."
 echo ""
 
-python3 schema_generator.py
+python3 schema_generator.py "$@"
 
 if [ $? -eq 0 ]; then
     echo ""
@@ -31,15 +31,15 @@ def check_csv_files():
         '08_faqs.csv'
     ]
     
-    missing_files = []
-    existing_files = []
+    # List the directory once instead of checking each file separately
+    try:
+        with os.scandir('schema_data') as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
     
-    for filename in required_files:
-        filepath = f'schema_data/{filename}'
-        if os.path.exists(filepath):
-            existing_files.append(filename)
-        else:
-            missing_files.append(filename)
+    existing_files = [f for f in required_files if f in present]
+    missing_files = [f for f in required_files if f not in present]
     
     print(f"\n📊 CSV File Status:")
     print(f"   Found: {len(existing_files)}/8")
@@ -61,21 +61,19 @@ def check_csv_files():
 
 
 def check_dependencies():
-    """Check if required Python packages are installed"""
+    """Report whether optional Python packages are installed"""
     try:
-        import pandas
-        print("✓ pandas is installed")
-        return True
+        import orjson
+        print("✓ orjson is installed")
     except ImportError:
-        print("✗ pandas is not installed")
+        print("⚠️  orjson is not installed, falling back to the standard json module")
         print("  → Run: pip install -r requirements.txt")
-        return False
 
 
 def run_test_generation():
     """Test the schema generator"""
     try:
-        from schema_generator import SchemaGenerator
+        from schema_generator import SchemaGenerator, serialize_schema
         
         print("\n🧪 Testing schema generator...")
         
@@ -83,7 +81,7 @@ def run_test_generation():
         generator.load_data()
         
         # Get first category
-        first_category = generator.category_data.iloc[0]['Category ID']
+        first_category = generator.category_data[0]['Category ID']
         print(f"   Generating test schema for: {first_category}")
         
         schema = generator.generate_schema_for_category(first_category)
@@ -98,10 +96,9 @@ def run_test_generation():
             print(f"   ✓ Schema validated successfully")
         
         # Save test file
-        import json
         test_file = f"output/test_{first_category}_schema.json"
-        with open(test_file, 'w') as f:
-            json.dump(schema, f, indent=2)
+        with open(test_file, 'wb') as f:
+            f.write(serialize_schema(schema, indent=2))
         
         print(f"   ✓ Test schema saved to: {test_file}")
         print(f"\n✅ Schema generator is working correctly!")
@@ -124,10 +121,7 @@ def main():
     
     # Step 2: Check dependencies
     print("\nStep 2: Checking Python dependencies...")
-    if not check_dependencies():
-        print("\n⚠️  Please install dependencies first:")
-        print("   pip install -r requirements.txt\n")
-        sys.exit(1)
+    check_dependencies()
     
     # Step 3: Check CSV files
     print("\nStep 3: Checking for CSV files...")
@@ -5,78 +5,338 @@ Reads CSV data and generates JSON-LD structured data for category pages
 Author: Technical SEO Team
 """
 
-import pandas as pd
+import argparse
+import csv
 import json
-from typing import Dict, List, Any
+import marshal
+from typing import Dict, List, Any, Callable, Optional, Tuple
 from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from operator import itemgetter
 import os
 
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # only needed when compiling with mypyc (see setup.py)
+    def mypyc_attr(*attrs, **kwattrs):  # type: ignore[misc]
+        return lambda cls: cls
 
+try:
+    import orjson
+except ImportError:  # fall back to the standard library encoder
+    orjson = None  # type: ignore[assignment]
+
+# Cell values treated as missing, matching the strings pandas reads as NaN
+NA_VALUES = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null'
+])
+
+Row = Dict[str, Any]
+
+# Numbered columns, formatted once instead of per row
+ABOUT_TOPIC_COLUMNS = tuple(
+    (f'about_topic_{i}_name', f'about_topic_{i}_description') for i in range(1, 4)  # 3 topics
+)
+COURSE_TOPIC_COLUMNS = tuple(f'course_topic_{i}' for i in range(1, 9))  # 8 topics
+CATEGORY_TAG_COLUMNS = tuple(f'category_{i}' for i in range(1, 7))  # 6 categories
+
+_get_course_topics = itemgetter(*COURSE_TOPIC_COLUMNS)
+_get_category_tags = itemgetter(*CATEGORY_TAG_COLUMNS)
+
+# Every course runs daily; one shared tuple (serialized as a JSON array)
+# instead of a new list per course
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Course schema properties copied straight from a courses CSV column
+COURSE_FIELD_MAP = (
+    ("name", "course_name"),
+    ("alternateName", "course_alternate_name"),
+    ("description", "course_description"),
+    ("url", "course_url"),
+    ("educationalCredentialAwarded", "course_credential"),
+    ("educationalLevel", "course_level"),
+    ("timeRequired", "course_duration_iso8601"),
+    ("abstract", "course_abstract"),
+    ("coursePrerequisites", "course_prerequisites"),
+    ("occupationalCredentialAwarded", "course_benefits"),
+    ("availableLanguage", "course_language"),
+    ("inLanguage", "course_in_language"),
+    ("educationalUse", "course_educational_use"),
+    ("learningResourceType", "course_learning_resource_type"),
+    ("typicalAgeRange", "course_age_range"),
+)
+
+
+def parse_position(value: Optional[str]) -> Optional[int]:
+    """Parse a position cell such as "2" or a float export like "2.0"; None if missing"""
+    if value is None:
+        return None
+    return int(float(value))
+
+
+def position_sort_key(value: Optional[str]) -> Tuple[bool, int]:
+    """Sort key for position cells that orders missing positions last, like pandas' sort_values"""
+    position = parse_position(value)
+    return position is None, position or 0
+
+
+def serialize_schema(schema: Dict[str, Any], indent: Optional[int] = None) -> bytes:
+    """
+    Serialize a schema to UTF-8 JSON bytes
+    
+    Args:
+        schema: Schema to serialize
+        indent: Pretty-print with this indent; None writes compact JSON.
+            orjson only supports 2-space indentation, so any indent uses that.
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(schema, option=option)
+    if indent:
+        return json.dumps(schema, indent=indent, ensure_ascii=False).encode('utf-8')
+    return json.dumps(schema, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Threads used to write schema files while generation continues
+WRITER_THREADS = 4
+
+# Generator shared by every task in a worker process, set by _init_worker()
+_worker_generator: Optional["SchemaGenerator"] = None
+
+
+def _init_worker(generator: "SchemaGenerator"):
+    """Receive the loaded generator once per worker process"""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_one(category_id: str, indent: Optional[int] = None) -> Tuple[str, Optional[bytes], Optional[str]]:
+    """Worker task: generate and serialize one category's schema"""
+    assert _worker_generator is not None
+    return _worker_generator.render_schema_for_category(category_id, indent)
+
+
+def _write_file(filename: str, data: bytes):
+    """Write serialized schema bytes to a file"""
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class SchemaGenerator:
     """Generate JSON-LD schema markup from CSV data"""
     
-    def __init__(self, data_directory: str = "./schema_data"):
+    # Table attribute -> source CSV file in the data directory
+    CSV_FILES = [
+        ('org_data', '01_organization_variables.csv'),
+        ('category_data', '02_category_pages.csv'),
+        ('about_topics_data', '03_category_about_topics.csv'),
+        ('courses_data', '04_courses_master_list.csv'),
+        ('topics_data', '05_course_topics.csv'),
+        ('areas_data', '06_area_served.csv'),
+        ('categories_data', '07_categories_tags.csv'),
+        ('faqs_data', '08_faqs.csv'),
+    ]
+    
+    # Parsed tables are cached here (inside the data directory) between runs
+    CACHE_FILE = ".cache/tables.marshal"
+    CACHE_VERSION = 3
+    
+    def __init__(self, data_directory: str = "./schema_data", use_cache: bool = True):
         """
         Initialize the schema generator
         
         Args:
             data_directory: Path to directory containing CSV files
+            use_cache: Reuse the parsed tables from the previous run while
+                none of the CSV files have changed
         """
         self.data_dir = data_directory
-        self.org_data = None
-        self.category_data = None
-        self.courses_data = None
-        self.topics_data = None
-        self.areas_data = None
-        self.categories_data = None
-        self.faqs_data = None
-        self.about_topics_data = None
+        self.use_cache = use_cache
+        self.org_data: List[Row] = []
+        self.category_data: List[Row] = []
+        self.courses_data: List[Row] = []
+        self.topics_data: List[Row] = []
+        self.areas_data: List[Row] = []
+        self.categories_data: List[Row] = []
+        self.faqs_data: List[Row] = []
+        self.about_topics_data: List[Row] = []
+        
+        # Organization variables and per-category row lookups, built once by load_data()
+        self._org: Dict[str, str] = {}
+        self._base_url = ""
+        self._org_ref: Dict[str, str] = {}
+        self._website_ref: Dict[str, str] = {}
+        self._website_schema: Dict[str, Any] = {}
+        self._organization_schema: Dict[str, Any] = {}
+        self._category_by_id: Dict[str, Row] = {}
+        self._about_by_cat: Dict[str, Row] = {}
+        self._courses_by_cat: Dict[str, List[Row]] = {}
+        self._topics_by_course: Dict[Tuple[str, int], Row] = {}
+        self._areas_by_cat: Dict[str, List[Row]] = {}
+        self._categories_by_cat: Dict[str, Row] = {}
+        self._faqs_by_cat: Dict[str, List[Row]] = {}
+        
+        # Generated areaServed / category arrays, keyed by Category ID
+        self._area_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._categories_cache: Dict[str, List[str]] = {}
         
     def load_data(self):
-        """Load all CSV files into pandas DataFrames"""
+        """Load all CSV files as lists of row dicts"""
         try:
-            self.org_data = pd.read_csv(f"{self.data_dir}/01_organization_variables.csv")
-            self.category_data = pd.read_csv(f"{self.data_dir}/02_category_pages.csv")
-            self.about_topics_data = pd.read_csv(f"{self.data_dir}/03_category_about_topics.csv")
-            self.courses_data = pd.read_csv(f"{self.data_dir}/04_courses_master_list.csv")
-            self.topics_data = pd.read_csv(f"{self.data_dir}/05_course_topics.csv")
-            self.areas_data = pd.read_csv(f"{self.data_dir}/06_area_served.csv")
-            self.categories_data = pd.read_csv(f"{self.data_dir}/07_categories_tags.csv")
-            self.faqs_data = pd.read_csv(f"{self.data_dir}/08_faqs.csv")
+            csv_paths = [f"{self.data_dir}/{filename}" for _, filename in self.CSV_FILES]
+            # Size and mtime of every CSV; the cache is only valid for an exact
+            # match, so replacing a file with an older copy still invalidates it
+            fingerprint = {}
+            for (_, filename), path in zip(self.CSV_FILES, csv_paths):
+                stat = os.stat(path)
+                fingerprint[filename] = (stat.st_size, stat.st_mtime_ns)
+            
+            tables = self._read_cache(fingerprint) if self.use_cache else None
+            if tables is None:
+                tables = {
+                    attr_name: self._read_csv(path)
+                    for (attr_name, _), path in zip(self.CSV_FILES, csv_paths)
+                }
+                if self.use_cache:
+                    self._write_cache(tables, fingerprint)
+            
+            for attr_name, rows in tables.items():
+                setattr(self, attr_name, rows)
             print("✓ All CSV files loaded successfully")
         except FileNotFoundError as e:
             print(f"✗ Error loading CSV files: {e}")
             print(f"  Make sure all CSV files are in the '{self.data_dir}' directory")
             raise
+        
+        self._build_indexes()
+    
+    def _read_cache(self, fingerprint: Dict[str, Tuple[int, int]]) -> Optional[Dict[str, List[Row]]]:
+        """Return the cached tables, or None if the cache is missing or stale"""
+        path = f"{self.data_dir}/{self.CACHE_FILE}"
+        try:
+            with open(path, 'rb') as f:
+                cached = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('version') != self.CACHE_VERSION:
+            return None
+        if cached.get('files') != fingerprint:
+            return None
+        tables = cached.get('tables')
+        if not isinstance(tables, dict) or set(tables) != {name for name, _ in self.CSV_FILES}:
+            return None
+        return tables
+    
+    def _write_cache(self, tables: Dict[str, List[Row]], fingerprint: Dict[str, Tuple[int, int]]):
+        """Save the parsed tables for the next run; failures only skip caching"""
+        path = f"{self.data_dir}/{self.CACHE_FILE}"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                marshal.dump({'version': self.CACHE_VERSION, 'files': fingerprint, 'tables': tables}, f)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _read_csv(path: str) -> List[Row]:
+        """
+        Read a CSV file into row dicts
+        
+        Missing cells (including placeholders such as 'N/A') are cleaned to None
+        here, so the generators can test values with a plain truthiness check.
+        Rows without a Category ID (e.g. blank ",,,," rows at the end of a
+        spreadsheet export) are skipped in the per-category tables.
+        """
+        rows = []
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            for raw_row in csv.DictReader(f):
+                row = {key: (None if value in NA_VALUES else value) for key, value in raw_row.items()}
+                if 'Category ID' in row and row['Category ID'] is None:
+                    continue
+                rows.append(row)
+        return rows
+    
+    @staticmethod
+    def _group_by_category(rows: List[Row]) -> Dict[str, List[Row]]:
+        """Split a table into per-category row lists in a single pass"""
+        groups = defaultdict(list)
+        for row in rows:
+            groups[row['Category ID']].append(row)
+        return dict(groups)
+    
+    @staticmethod
+    def _first_by_key(rows: List[Row], key: Callable[[Row], Any]) -> Dict[Any, Row]:
+        """Map each key to the first row that has it"""
+        index: Dict[Any, Row] = {}
+        for row in rows:
+            index.setdefault(key(row), row)
+        return index
+    
+    def _build_indexes(self):
+        """Index every table by Category ID so lookups don't rescan the tables"""
+        self._org = {}
+        for row in self.org_data:
+            self._org.setdefault(row['Variable Name'] or "", row['Value'] or "")
+        self._base_url = self._org.get('base_url', "")
+        
+        # Shared "@id" references; schemas are only ever serialized, never
+        # mutated, so every reference can point at the same dict
+        self._org_ref = {"@id": f"{self._base_url}/#organization"}
+        self._website_ref = {"@id": f"{self._base_url}/#website"}
+        
+        # These only depend on the organization variables, so every category
+        # page shares the same objects
+        self._website_schema = self.generate_website_schema()
+        self._organization_schema = self.generate_organization_schema()
+        
+        by_category = itemgetter('Category ID')
+        self._category_by_id = self._first_by_key(self.category_data, by_category)
+        self._about_by_cat = self._first_by_key(self.about_topics_data, by_category)
+        self._categories_by_cat = self._first_by_key(self.categories_data, by_category)
+        # Rows without a course_position can't match a course, so they are skipped
+        # (pandas' groupby dropped these NaN keys the same way)
+        self._topics_by_course = self._first_by_key(
+            [row for row in self.topics_data if row['course_position'] is not None],
+            lambda row: (row['Category ID'], parse_position(row['course_position']))
+        )
+        self._courses_by_cat = self._group_by_category(self.courses_data)
+        self._areas_by_cat = self._group_by_category(self.areas_data)
+        self._faqs_by_cat = self._group_by_category(self.faqs_data)
+        self._area_cache = {}
+        self._categories_cache = {}
     
     def get_org_value(self, variable_name: str) -> str:
         """Get organization variable value by name"""
-        row = self.org_data[self.org_data['Variable Name'] == variable_name]
-        if not row.empty:
-            return str(row.iloc[0]['Value'])
-        return ""
+        return self._org.get(variable_name, "")
     
     def generate_website_schema(self) -> Dict[str, Any]:
         """Generate WebSite schema"""
         return {
             "@type": "WebSite",
             "name": self.get_org_value('organization_name'),
-            "@id": f"{self.get_org_value('base_url')}/#website",
-            "url": self.get_org_value('base_url'),
+            "@id": self._website_ref["@id"],
+            "url": self._base_url,
             "description": self.get_org_value('organization_description'),
-            "publisher": {
-                "@id": f"{self.get_org_value('base_url')}/#organization"
-            }
+            "publisher": self._org_ref
         }
     
     def generate_organization_schema(self) -> Dict[str, Any]:
         """Generate EducationalOrganization schema"""
         return {
             "@type": "EducationalOrganization",
-            "@id": f"{self.get_org_value('base_url')}/#organization",
+            "@id": self._org_ref["@id"],
             "name": self.get_org_value('organization_name'),
             "description": self.get_org_value('organization_long_description'),
-            "url": self.get_org_value('base_url'),
+            "url": self._base_url,
             "logo": self.get_org_value('organization_logo_url'),
             "sameAs": [
                 self.get_org_value('social_facebook'),
@@ -89,12 +349,12 @@ class SchemaGenerator:
             "award": self.get_org_value('organization_award')
         }
     
-    def generate_breadcrumb_schema(self, category_row: pd.Series) -> Dict[str, Any]:
+    def generate_breadcrumb_schema(self, category_row: Row) -> Dict[str, Any]:
         """Generate BreadcrumbList schema"""
         breadcrumb_items = []
         
         # Add first breadcrumb
-        if pd.notna(category_row['breadcrumb_1_name']):
+        if category_row['breadcrumb_1_name']:
             breadcrumb_items.append({
                 "@type": "ListItem",
                 "position": 1,
@@ -103,7 +363,7 @@ class SchemaGenerator:
             })
         
         # Add second breadcrumb (current page)
-        if pd.notna(category_row['breadcrumb_2_name']):
+        if category_row['breadcrumb_2_name']:
             breadcrumb_items.append({
                 "@type": "ListItem",
                 "position": 2,
@@ -118,16 +378,11 @@ class SchemaGenerator:
     def generate_about_topics(self, category_id: str) -> List[Dict[str, Any]]:
         """Generate about topics for category"""
         topics = []
-        about_row = self.about_topics_data[
-            self.about_topics_data['Category ID'] == category_id
-        ]
-        
-        if not about_row.empty:
-            row = about_row.iloc[0]
-            for i in range(1, 4):  # 3 topics
-                topic_name = f'about_topic_{i}_name'
-                topic_desc = f'about_topic_{i}_description'
-                if pd.notna(row[topic_name]):
+        row = self._about_by_cat.get(category_id)
+        
+        if row is not None:
+            for topic_name, topic_desc in ABOUT_TOPIC_COLUMNS:
+                if row[topic_name]:
                     topics.append({
                         "@type": "Thing",
                         "name": row[topic_name],
@@ -136,7 +391,7 @@ class SchemaGenerator:
         
         return topics
     
-    def generate_collection_page_schema(self, category_row: pd.Series) -> Dict[str, Any]:
+    def generate_collection_page_schema(self, category_row: Row) -> Dict[str, Any]:
         """Generate CollectionPage schema"""
         category_id = category_row['Category ID']
         
@@ -150,54 +405,37 @@ class SchemaGenerator:
             "alternativeHeadline": category_row['category_page_alternative_headline'],
             "about": self.generate_about_topics(category_id),
             "keywords": category_row['category_keywords'],
-            "isPartOf": {
-                "@id": f"{self.get_org_value('base_url')}/#website"
-            },
+            "isPartOf": self._website_ref,
             "breadcrumb": self.generate_breadcrumb_schema(category_row),
             "mainEntity": {
                 "@id": f"#{category_row['catalog_id']}"
             }
         }
     
-    def generate_course_schema(self, course_row: pd.Series, category_row: pd.Series) -> Dict[str, Any]:
-        """Generate Course schema for a single course"""
+    def generate_course_schema(self, course_row: Row, category_row: Row) -> Dict[str, Any]:
+        """Generate Course schema for a single course record"""
         category_id = course_row['Category ID']
-        course_position = int(course_row['course_position'])
+        course_position = parse_position(course_row['course_position'])
+        if course_position is None:
+            raise ValueError(f"Course '{course_row['course_name']}' in '{category_id}' has no course_position")
         
         # Get course topics
-        topics_row = self.topics_data[
-            (self.topics_data['Category ID'] == category_id) &
-            (self.topics_data['course_position'] == course_position)
-        ]
+        topic_row = self._topics_by_course.get((category_id, course_position))
         
         teaches = []
-        if not topics_row.empty:
-            topic_row = topics_row.iloc[0]
-            for i in range(1, 9):  # 8 topics
-                topic_col = f'course_topic_{i}'
-                if pd.notna(topic_row[topic_col]):
-                    teaches.append(topic_row[topic_col])
-        
-        # Build course schema
-        course_schema = {
-            "@type": "Course",
-            "position": course_position,
-            "name": course_row['course_name'],
-            "alternateName": course_row['course_alternate_name'],
-            "description": course_row['course_description'],
-            "url": course_row['course_url'],
-            "educationalCredentialAwarded": course_row['course_credential'],
-            "educationalLevel": course_row['course_level'],
-            "timeRequired": course_row['course_duration_iso8601'],
-            "abstract": course_row['course_abstract'],
-            "coursePrerequisites": course_row['course_prerequisites'],
-            "occupationalCredentialAwarded": course_row['course_benefits'],
+        if topic_row is not None:
+            teaches = [topic for topic in _get_course_topics(topic_row) if topic]
+        
+        # Build course schema: flat properties first, then the nested objects
+        course_schema: Dict[str, Any] = {"@type": "Course", "position": course_position}
+        course_schema.update({key: course_row[column] for key, column in COURSE_FIELD_MAP})
+        course_schema.update({
             "teaches": teaches,
+            "interactivityType": "mixed",
             "audience": {
                 "@type": "Audience",
                 "audienceType": course_row['course_audience_type']
             },
-            "availableLanguage": course_row['course_language'],
             "hasCourseInstance": {
                 "@type": "CourseInstance",
                 "courseMode": [course_row['course_mode_1']],
@@ -206,7 +444,7 @@ class SchemaGenerator:
                     "@type": "Schedule",
                     "scheduleTimezone": course_row['course_timezone'],
                     "repeatFrequency": "P1D",
-                    "byDay": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+                    "byDay": WEEKDAYS
                 },
                 "instructor": {
                     "@type": "Organization",
@@ -232,13 +470,10 @@ class SchemaGenerator:
                 },
                 "deliveryMethod": "OnlineOnly"
             },
-            "provider": {
-                "@id": f"{self.get_org_value('base_url')}/#organization"
-            },
+            "provider": self._org_ref,
             "isPartOf": {
                 "@id": f"{category_row['category_page_url']}#catalog"
             },
-            "inLanguage": course_row['course_in_language'],
             "locationCreated": {
                 "@type": course_row['location_created_type'],
                 "name": course_row['location_created_name'],
@@ -247,23 +482,19 @@ class SchemaGenerator:
                     "addressRegion": course_row['location_created_region'],
                     "addressCountry": "US"
                 }
-            },
-            "educationalUse": course_row['course_educational_use'],
-            "learningResourceType": course_row['course_learning_resource_type'],
-            "interactivityType": "mixed",
-            "typicalAgeRange": course_row['course_age_range']
-        }
+            }
+        })
         
-        # Add course code if present
-        if pd.notna(course_row['course_code']) and course_row['course_code'] != 'N/A':
+        # Add course code if present ('N/A' is already cleaned to None at load time)
+        if course_row['course_code']:
             course_schema['courseCode'] = course_row['course_code']
         
         # Add second course mode if present
-        if pd.notna(course_row['course_mode_2']):
+        if course_row['course_mode_2']:
             course_schema['hasCourseInstance']['courseMode'].append(course_row['course_mode_2'])
         
         # Add geographic area to audience if present
-        if pd.notna(course_row['geographic_type']):
+        if course_row['geographic_type']:
             course_schema['audience']['geographicArea'] = {
                 "@type": course_row['geographic_type'],
                 "name": course_row['geographic_name']
@@ -273,10 +504,12 @@ class SchemaGenerator:
     
     def generate_area_served(self, category_id: str) -> List[Dict[str, Any]]:
         """Generate areaServed array for catalog"""
-        areas = []
-        area_rows = self.areas_data[self.areas_data['Category ID'] == category_id]
+        cached = self._area_cache.get(category_id)
+        if cached is not None:
+            return cached
         
-        for _, row in area_rows.iterrows():
+        areas = []
+        for row in self._areas_by_cat.get(category_id, []):
             areas.append({
                 "@type": "State",
                 "name": row['area_served_name'],
@@ -289,34 +522,37 @@ class SchemaGenerator:
                 "description": row['area_served_description']
             })
         
+        self._area_cache[category_id] = areas
         return areas
     
     def generate_categories(self, category_id: str) -> List[str]:
         """Generate category tags array"""
+        cached = self._categories_cache.get(category_id)
+        if cached is not None:
+            return cached
+        
         categories = []
-        cat_row = self.categories_data[self.categories_data['Category ID'] == category_id]
+        row = self._categories_by_cat.get(category_id)
         
-        if not cat_row.empty:
-            row = cat_row.iloc[0]
-            for i in range(1, 7):  # 6 categories
-                cat_col = f'category_{i}'
-                if pd.notna(row[cat_col]):
-                    categories.append(row[cat_col])
+        if row is not None:
+            categories = [tag for tag in _get_category_tags(row) if tag]
         
+        self._categories_cache[category_id] = categories
         return categories
     
-    def generate_offer_catalog_schema(self, category_row: pd.Series) -> Dict[str, Any]:
+    def generate_offer_catalog_schema(self, category_row: Row) -> Dict[str, Any]:
         """Generate OfferCatalog schema with all courses"""
         category_id = category_row['Category ID']
         
         # Get all courses for this category
-        category_courses = self.courses_data[
-            self.courses_data['Category ID'] == category_id
-        ].sort_values('course_position')
+        category_courses = sorted(
+            self._courses_by_cat.get(category_id, []),
+            key=lambda row: position_sort_key(row['course_position'])
+        )
         
         # Generate course schemas
         course_list = []
-        for _, course_row in category_courses.iterrows():
+        for course_row in category_courses:
             course_schema = self.generate_course_schema(course_row, category_row)
             course_list.append(course_schema)
         
@@ -326,9 +562,7 @@ class SchemaGenerator:
             "name": category_row['catalog_name'],
             "description": category_row['catalog_description'],
             "numberOfItems": int(category_row['total_courses']),
-            "provider": {
-                "@id": f"{self.get_org_value('base_url')}/#organization"
-            },
+            "provider": self._org_ref,
             "itemListElement": course_list,
             "areaServed": self.generate_area_served(category_id),
             "category": self.generate_categories(category_id)
@@ -336,13 +570,14 @@ class SchemaGenerator:
     
     def generate_faq_schema(self, category_id: str, category_url: str) -> Dict[str, Any]:
         """Generate FAQPage schema"""
-        faq_rows = self.faqs_data[
-            self.faqs_data['Category ID'] == category_id
-        ].sort_values('faq_position')
+        faq_rows = sorted(
+            self._faqs_by_cat.get(category_id, []),
+            key=lambda row: position_sort_key(row['faq_position'])
+        )
         
         faq_items = []
-        for _, row in faq_rows.iterrows():
-            if pd.notna(row['faq_question']):
+        for row in faq_rows:
+            if row['faq_question']:
                 faq_items.append({
                     "@type": "Question",
                     "name": row['faq_question'],
@@ -361,21 +596,17 @@ class SchemaGenerator:
     def generate_schema_for_category(self, category_id: str) -> Dict[str, Any]:
         """Generate complete schema for a category page"""
         # Get category data
-        category_row = self.category_data[
-            self.category_data['Category ID'] == category_id
-        ]
+        category_row = self._category_by_id.get(category_id)
         
-        if category_row.empty:
+        if category_row is None:
             raise ValueError(f"Category ID '{category_id}' not found in category_pages.csv")
         
-        category_row = category_row.iloc[0]
-        
         # Build complete schema
         schema = {
             "@context": "https://schema.org",
             "@graph": [
-                self.generate_website_schema(),
-                self.generate_organization_schema(),
+                self._website_schema,
+                self._organization_schema,
                 self.generate_collection_page_schema(category_row),
                 self.generate_offer_catalog_schema(category_row),
                 self.generate_faq_schema(category_id, category_row['category_page_url'])
@@ -384,30 +615,81 @@ class SchemaGenerator:
         
         return schema
     
-    def generate_all_schemas(self, output_dir: str = "./output"):
-        """Generate schemas for all categories and save to files"""
+    def render_schema_for_category(self, category_id: str,
+                                   indent: Optional[int] = None) -> Tuple[str, Optional[bytes], Optional[str]]:
+        """
+        Generate one category's schema and serialize it to JSON bytes
+        
+        Args:
+            category_id: Category to generate
+            indent: JSON indent, or None for compact output
+        
+        Returns:
+            (category_id, data, error) - data is None and error holds the
+            message if generation failed
+        """
+        try:
+            schema = self.generate_schema_for_category(category_id)
+            return category_id, serialize_schema(schema, indent), None
+        except Exception as e:
+            return category_id, None, str(e)
+    
+    def generate_all_schemas(self, output_dir: str = "./output", max_workers: int = 1,
+                             indent: Optional[int] = None):
+        """
+        Generate schemas for all categories and save to files
+        
+        Args:
+            output_dir: Directory to write the schema files to
+            max_workers: Number of worker processes; the default 1 generates in
+                the current process, 0 uses the CPU count. Worker processes only
+                pay off for large catalogs, and scripts using them need an
+                if __name__ == "__main__" guard
+            indent: JSON indent for readable files; the default None writes
+                compact JSON, which is all a <script> tag needs
+        """
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        generated_files = []
+        generated_files: List[str] = []
+        category_ids = [row['Category ID'] for row in self.category_data]
+        workers = min(max_workers or os.cpu_count() or 1, len(category_ids))
+        outcomes: List[Tuple[str, str, Optional[Future], Optional[str]]] = []
         
-        # Generate schema for each category
-        for _, row in self.category_data.iterrows():
-            category_id = row['Category ID']
+        with ExitStack() as stack:
+            # Files are written on a small thread pool so disk latency overlaps
+            # with generating the next schemas
+            writer = stack.enter_context(ThreadPoolExecutor(max_workers=WRITER_THREADS))
+            
+            # Generate schema for each category; categories are independent, so
+            # they can be spread across processes
+            if workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker, initargs=(self,)
+                ))
+                results = executor.map(
+                    partial(_generate_one, indent=indent), category_ids, chunksize=4
+                )
+            else:
+                results = map(partial(self.render_schema_for_category, indent=indent), category_ids)
             
-            try:
-                schema = self.generate_schema_for_category(category_id)
-                
-                # Save to file
+            for category_id, data, error in results:
                 filename = f"{output_dir}/{category_id}_schema.json"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(schema, f, indent=2, ensure_ascii=False)
-                
+                write = writer.submit(_write_file, filename, data) if data is not None else None
+                outcomes.append((category_id, filename, write, error))
+        
+        for category_id, filename, write, error in outcomes:
+            if write is not None:
+                try:
+                    write.result()
+                except Exception as e:
+                    error = str(e)
+            
+            if error is None:
                 generated_files.append(filename)
                 print(f"✓ Generated schema for: {category_id}")
-                
-            except Exception as e:
-                print(f"✗ Error generating schema for {category_id}: {e}")
+            else:
+                print(f"✗ Error generating schema for {category_id}: {error}")
         
         return generated_files
     
@@ -422,18 +704,27 @@ class SchemaGenerator:
             warnings.append("Missing @graph")
         
         # Check for required schema types
-        schema_types = [item.get("@type") for item in schema.get("@graph", [])]
+        schema_types = {item.get("@type") for item in schema.get("@graph", [])}
         required_types = ["WebSite", "EducationalOrganization", "CollectionPage", "OfferCatalog"]
         
-        for req_type in required_types:
-            if req_type not in schema_types:
-                warnings.append(f"Missing required schema type: {req_type}")
+        # Set difference would lose the reporting order, so test membership per type
+        warnings.extend(
+            f"Missing required schema type: {req_type}"
+            for req_type in required_types if req_type not in schema_types
+        )
         
         return warnings
 
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Generate JSON-LD schema files for category pages")
+    parser.add_argument('--pretty', action='store_true',
+                        help="write indented JSON instead of compact JSON")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes for generation (default: 1, 0 = CPU count)")
+    args = parser.parse_args()
+    
     print("\n" + "="*60)
     print("Category Page Schema Generator")
     print("="*60 + "\n")
@@ -450,7 +741,9 @@ def main():
         return
     
     print("\nGenerating schemas...")
-    generated_files = generator.generate_all_schemas(output_dir="./output")
+    generated_files = generator.generate_all_schemas(
+        output_dir="./output", max_workers=args.workers, indent=2 if args.pretty else None
+    )
     
     print("\n" + "="*60)
     print(f"✓ Successfully generated {len(generated_files)} schema files")
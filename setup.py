@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Optional native build of the schema generator
+Compiles schema_generator.py with mypyc for faster schema assembly on large catalogs
+
+Usage:
+    pip install mypy
+    python setup.py build_ext --inplace
+
+The plain schema_generator.py keeps working without this step.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+
+setup(
+    name="category-page-schema-generator",
+    py_modules=[],
+    ext_modules=mypycify(["schema_generator.py"]),
+)